@@ -268,6 +268,8 @@ class RESTObjectList:
         _list: A GitlabList object
     """
 
+    __slots__ = ("manager", "_obj_cls", "_list")
+
     def __init__(
         self, manager: "RESTManager", obj_cls: Type[RESTObject], _list: GitlabList
     ) -> None:
@@ -1,6 +1,5 @@
 import argparse
 import dataclasses
-import functools
 import os
 import pathlib
 import re
@@ -9,7 +8,6 @@ from types import ModuleType
 from typing import (
     Any,
     Callable,
-    cast,
     Dict,
     Optional,
     Tuple,
@@ -64,10 +62,6 @@ def register_custom_action(
     help: Optional[str] = None,  # help text for the action
 ) -> Callable[[__F], __F]:
     def wrap(f: __F) -> __F:
-        @functools.wraps(f)
-        def wrapped_f(*args: Any, **kwargs: Any) -> Any:
-            return f(*args, **kwargs)
-
         # in_obj defines whether the method belongs to the obj or the manager
         in_obj = True
         if isinstance(cls_names, tuple):
@@ -92,7 +86,9 @@ def register_custom_action(
                 help=help,
             )
 
-        return cast(__F, wrapped_f)
+        # The action is only recorded for the CLI, so return the function itself
+        # rather than a wrapper that would add a call frame on every invocation.
+        return f
 
     return wrap
 
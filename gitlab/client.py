@@ -1,5 +1,6 @@
 """Wrapper for the GitLab API."""
 
+import dataclasses
 import os
 import re
 import time
@@ -651,6 +652,7 @@ class Gitlab:
         obey_rate_limit: bool = True,
         retry_transient_errors: Optional[bool] = None,
         max_retries: int = 10,
+        extra_headers: Optional[Dict[str, str]] = None,
         **kwargs: Any,
     ) -> requests.Response:
         """Make an HTTP request to the Gitlab server.
@@ -672,10 +674,12 @@ class Gitlab:
                 or 52x responses. Defaults to False.
             max_retries: Max retries after 429 or transient errors,
                                set to -1 to retry forever. Defaults to 10.
+            extra_headers: Extra HTTP headers to send with this request only
             **kwargs: Extra options to send to the server (e.g. sudo)
 
         Returns:
-            A requests result object.
+            A requests result object. A 304 (Not Modified) response is also
+            returned as-is when an ``If-None-Match`` header was sent.
 
         Raises:
             GitlabHttpError: When the return code is not 2xx
@@ -705,6 +709,9 @@ class Gitlab:
             utils.copy_dict(src=kwargs, dest=params)
 
         opts = self._get_session_opts()
+        if extra_headers:
+            opts["headers"].update(extra_headers)
+        conditional = "If-None-Match" in opts["headers"]
 
         verify = opts.pop("verify")
         opts_timeout = opts.pop("timeout")
@@ -748,6 +755,9 @@ class Gitlab:
             if 200 <= result.status_code < 300:
                 return result.response
 
+            if result.status_code == 304 and conditional:
+                return result.response
+
             def should_retry() -> bool:
                 if result.status_code == 429 and obey_rate_limit:
                     return True
@@ -831,7 +841,7 @@ class Gitlab:
 
         if content_type == "application/json" and not streamed and not raw:
             try:
-                json_result = result.json()
+                json_result = utils.response_json(result)
                 if TYPE_CHECKING:
                     assert isinstance(json_result, dict)
                 return json_result
@@ -1010,7 +1020,7 @@ class Gitlab:
 
         try:
             if content_type == "application/json":
-                json_result = result.json()
+                json_result = utils.response_json(result)
                 if TYPE_CHECKING:
                     assert isinstance(json_result, dict)
                 return json_result
@@ -1063,7 +1073,7 @@ class Gitlab:
         if result.status_code in gitlab.const.NO_JSON_RESPONSE_CODES:
             return result
         try:
-            json_result = result.json()
+            json_result = utils.response_json(result)
             if TYPE_CHECKING:
                 assert isinstance(json_result, dict)
             return json_result
@@ -1113,7 +1123,7 @@ class Gitlab:
         if result.status_code in gitlab.const.NO_JSON_RESPONSE_CODES:
             return result
         try:
-            json_result = result.json()
+            json_result = utils.response_json(result)
             if TYPE_CHECKING:
                 assert isinstance(json_result, dict)
             return json_result
@@ -1160,11 +1170,35 @@ class Gitlab:
         return self.http_list("/search", query_data=data, **kwargs)
 
 
+# Number of list pages kept in an ETag cache before the least recently used
+# one is evicted
+_ETAG_CACHE_MAX_PAGES = 32
+
+
+@dataclasses.dataclass
+class _CachedPage:
+    """A list page kept to answer conditional requests.
+
+    The raw body is kept rather than the decoded items, so that each reuse
+    hands out new dicts which callers are free to modify.
+    """
+
+    etag: str
+    next_url: Optional[str]
+    headers: "requests.structures.CaseInsensitiveDict[str]"
+    content: bytes
+
+
 class GitlabList:
     """Generator representing a list of remote objects.
 
     The object handles the links returned by a query to the API, and will call
     the API again when needed.
+
+    If an ``etag_cache`` dict is given, pages are stored in it along with their
+    ``ETag`` and later requests for the same page send ``If-None-Match``, so an
+    unchanged page is answered by the server with an empty 304 response and
+    served from the cache. The cache keeps the most recently used pages only.
     """
 
     def __init__(
@@ -1173,9 +1207,11 @@ class GitlabList:
         url: str,
         query_data: Dict[str, Any],
         get_next: bool = True,
+        etag_cache: Optional[Dict[str, _CachedPage]] = None,
         **kwargs: Any,
     ) -> None:
         self._gl = gl
+        self._etag_cache = etag_cache
 
         # Preserve kwargs for subsequent queries
         self._kwargs = kwargs.copy()
@@ -1190,27 +1226,74 @@ class GitlabList:
         self, url: str, query_data: Optional[Dict[str, Any]] = None, **kwargs: Any
     ) -> None:
         query_data = query_data or {}
+        cache_key = None
+        cached = None
+        if self._etag_cache is not None:
+            cache_key = (
+                f"{url} {sorted(query_data.items())!r} {sorted(kwargs.items())!r}"
+            )
+            cached = self._etag_cache.get(cache_key)
+        if cached is not None:
+            extra_headers = {
+                **kwargs.get("extra_headers", {}),
+                "If-None-Match": cached.etag,
+            }
+            kwargs = {**kwargs, "extra_headers": extra_headers}
+
         result = self._gl.http_request("get", url, query_data=query_data, **kwargs)
+        if cached is not None and result.status_code == 304:
+            if TYPE_CHECKING:
+                assert self._etag_cache is not None and cache_key is not None
+            # Move the page to the end of the cache, as most recently used
+            self._etag_cache[cache_key] = self._etag_cache.pop(cache_key)
+            self._set_page(
+                cached.next_url, cached.headers, utils.json_loads(cached.content)
+            )
+            return
+
         try:
             next_url = result.links["next"]["url"]
         except KeyError:
             next_url = None
 
-        self._next_url = self._gl._check_url(next_url)
-        self._current_page: Optional[str] = result.headers.get("X-Page")
-        self._prev_page: Optional[str] = result.headers.get("X-Prev-Page")
-        self._next_page: Optional[str] = result.headers.get("X-Next-Page")
-        self._per_page: Optional[str] = result.headers.get("X-Per-Page")
-        self._total_pages: Optional[str] = result.headers.get("X-Total-Pages")
-        self._total: Optional[str] = result.headers.get("X-Total")
-
         try:
-            self._data: List[Dict[str, Any]] = result.json()
+            data: List[Dict[str, Any]] = utils.response_json(result)
         except Exception as e:
             raise gitlab.exceptions.GitlabParsingError(
                 error_message="Failed to parse the server message"
             ) from e
 
+        next_url = self._gl._check_url(next_url)
+        self._set_page(next_url, result.headers, data)
+
+        etag = result.headers.get("ETag")
+        if cache_key is not None and etag is not None:
+            if TYPE_CHECKING:
+                assert self._etag_cache is not None
+            self._etag_cache.pop(cache_key, None)
+            self._etag_cache[cache_key] = _CachedPage(
+                etag=etag,
+                next_url=next_url,
+                headers=result.headers,
+                content=result.content,
+            )
+            while len(self._etag_cache) > _ETAG_CACHE_MAX_PAGES:
+                del self._etag_cache[next(iter(self._etag_cache))]
+
+    def _set_page(
+        self,
+        next_url: Optional[str],
+        headers: "requests.structures.CaseInsensitiveDict[str]",
+        data: List[Dict[str, Any]],
+    ) -> None:
+        self._next_url = next_url
+        self._current_page: Optional[str] = headers.get("X-Page")
+        self._prev_page: Optional[str] = headers.get("X-Prev-Page")
+        self._next_page: Optional[str] = headers.get("X-Next-Page")
+        self._per_page: Optional[str] = headers.get("X-Per-Page")
+        self._total_pages: Optional[str] = headers.get("X-Total-Pages")
+        self._total: Optional[str] = headers.get("X-Total")
+        self._data = data
         self._current = 0
 
     @property
@@ -1,5 +1,5 @@
 import dataclasses
-from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple, TYPE_CHECKING
 
 
 @dataclasses.dataclass(frozen=True)
@@ -8,23 +8,33 @@ class RequiredOptional:
     optional: Tuple[str, ...] = ()
     exclusive: Tuple[str, ...] = ()
 
+    # Lookup sets built once per instance, as the attrs are declared at class level
+    # on the managers and validated on every create/update call.
+    _required_set: FrozenSet[str] = dataclasses.field(
+        init=False, repr=False, compare=False
+    )
+    _exclusive_set: FrozenSet[str] = dataclasses.field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_required_set", frozenset(self.required))
+        object.__setattr__(self, "_exclusive_set", frozenset(self.exclusive))
+
     def validate_attrs(
         self,
         *,
         data: Dict[str, Any],
         excludes: Optional[List[str]] = None,
     ) -> None:
-        if excludes is None:
-            excludes = []
-
         if self.required:
-            required = [k for k in self.required if k not in excludes]
-            missing = [attr for attr in required if attr not in data]
-            if missing:
+            missing_set = self._required_set.difference(data, excludes or ())
+            if missing_set:
+                missing = [attr for attr in self.required if attr in missing_set]
                 raise AttributeError(f"Missing attributes: {', '.join(missing)}")
 
         if self.exclusive:
-            exclusives = [attr for attr in data if attr in self.exclusive]
+            exclusives = [attr for attr in data if attr in self._exclusive_set]
             if len(exclusives) > 1:
                 raise AttributeError(
                     f"Provide only one of these attributes: {', '.join(exclusives)}"
@@ -66,7 +76,7 @@ class _ListArrayAttribute(GitlabAttribute):
 
         if TYPE_CHECKING:
             assert isinstance(self._value, list)
-        return (key, ",".join([str(x) for x in self._value]))
+        return (key, ",".join(map(str, self._value)))
 
 
 class ArrayAttribute(_ListArrayAttribute):
@@ -1,15 +1,38 @@
+import concurrent.futures
 import email.message
+import json
 import logging
 import pathlib
+import re
 import traceback
 import urllib.parse
 import warnings
-from typing import Any, Callable, Dict, Iterator, Literal, Optional, Tuple, Type, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 import requests
 
 from gitlab import types
 
+try:
+    import orjson
+
+    _json_loads: Optional[Callable[[bytes], Any]] = orjson.loads
+except ImportError:
+    _json_loads = None
+
 
 class _StdoutStream:
     def __call__(self, chunk: Any) -> None:
@@ -72,6 +95,55 @@ def response_content(
     return None
 
 
+def json_loads(content: bytes) -> Any:
+    """Decode a JSON document, using orjson when it is installed."""
+    if _json_loads is None:
+        return json.loads(content)
+    return _json_loads(content)
+
+
+def response_json(response: requests.Response) -> Any:
+    """Decode the JSON body of a response, using orjson when it is installed."""
+    if _json_loads is None:
+        return response.json()
+    return json_loads(response.content)
+
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+
+def map_concurrently(
+    func: Callable[[_T], _R], items: Iterable[_T], max_workers: int
+) -> List[Tuple[_T, Union[_R, Exception]]]:
+    """Call a function on several items using a pool of threads.
+
+    An exception raised for an item, such as a GitlabError or a connection
+    error, is returned in place of its result, so that one failure does not
+    discard the results of the other items.
+
+    Args:
+        func: The function to call on each item
+        items: The items to call the function on
+        max_workers: The maximum number of calls running at the same time
+
+    Returns:
+        A list of ``(item, result)`` tuples in the order of ``items``, where
+        ``result`` is the error raised if the call failed.
+    """
+
+    def _call(item: _T) -> Union[_R, Exception]:
+        try:
+            return func(item)
+        except Exception as e:
+            return e
+
+    items = list(items)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+        results = list(pool.map(_call, items))
+    return list(zip(items, results))
+
+
 def _transform_types(
     data: Dict[str, Any],
     custom_types: Dict[str, Any],
@@ -142,6 +214,11 @@ def copy_dict(
             dest[k] = v
 
 
+# Strings made only of these characters are URL-encoded by just escaping "/", as
+# urllib.parse.quote() leaves all the others unchanged.
+_SAFE_PATH_RE = re.compile(r"[A-Za-z0-9_.~/-]*")
+
+
 class EncodedId(str):
     """A custom `str` class that will return the URL-encoded value of the string.
 
@@ -164,7 +241,10 @@ class EncodedId(str):
         if not isinstance(value, (int, str)):
             raise TypeError(f"Unsupported type received: {type(value)}")
         if isinstance(value, str):
-            value = urllib.parse.quote(value, safe="")
+            if _SAFE_PATH_RE.fullmatch(value):
+                value = value.replace("/", "%2F")
+            else:
+                value = urllib.parse.quote(value, safe="")
         return super().__new__(cls, value)
 
 
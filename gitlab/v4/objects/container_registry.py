@@ -1,7 +1,8 @@
-from typing import Any, cast, TYPE_CHECKING, Union
+from typing import Any, cast, Dict, List, Optional, Tuple, TYPE_CHECKING, Union
 
 from gitlab import cli
 from gitlab import exceptions as exc
+from gitlab import utils
 from gitlab.base import RESTManager, RESTObject
 from gitlab.mixins import (
     DeleteMixin,
@@ -70,6 +71,47 @@ class ProjectRegistryTagManager(DeleteMixin, RetrieveMixin, RESTManager):
             assert self.path is not None
         self.gitlab.http_delete(self.path, query_data=data, **kwargs)
 
+    def delete_in_bulk_many(
+        self,
+        specs: List[Dict[str, Any]],
+        max_workers: int = 4,
+        **kwargs: Any,
+    ) -> List[Tuple[Dict[str, Any], Optional[Exception]]]:
+        """Run several bulk tag deletions concurrently.
+
+        Each spec holds the arguments of a single :meth:`delete_in_bulk` call.
+        The requests share the connection pool of the Gitlab session.
+
+        Args:
+            specs: A list of dicts with the ``name_regex_delete`` key and,
+                optionally, ``keep_n``, ``name_regex_keep`` and ``older_than``
+            max_workers: The maximum number of requests sent at the same time
+            **kwargs: Extra options to send to the server (e.g. sudo)
+
+        Raises:
+            ValueError: If a spec lacks ``name_regex_delete`` or repeats a
+                keyword argument; no request is sent in that case
+
+        Returns:
+            A list of ``(spec, error)`` tuples in the order of ``specs``, where
+            ``error`` is ``None`` if the deletion request succeeded, or else the
+            exception it raised (e.g. GitlabDeleteError or a connection error).
+        """
+        for spec in specs:
+            if "name_regex_delete" not in spec:
+                raise ValueError(f"Missing 'name_regex_delete' in spec {spec!r}")
+            clashes = sorted(spec.keys() & kwargs.keys())
+            if clashes:
+                raise ValueError(
+                    f"Spec {spec!r} repeats the keyword arguments: "
+                    f"{', '.join(clashes)}"
+                )
+
+        def _delete(spec: Dict[str, Any]) -> None:
+            self.delete_in_bulk(**spec, **kwargs)
+
+        return utils.map_concurrently(_delete, specs, max_workers)
+
     def get(
         self, id: Union[str, int], lazy: bool = False, **kwargs: Any
     ) -> ProjectRegistryTag:
@@ -1,4 +1,5 @@
 import base64
+import functools
 from typing import (
     Any,
     Callable,
@@ -33,6 +34,20 @@ __all__ = [
 ]
 
 
+@functools.lru_cache(maxsize=4096)
+def _encode_path(file_path: str) -> utils.EncodedId:
+    return utils.EncodedId(file_path)
+
+
+def _encoded_path(file_path: str) -> utils.EncodedId:
+    """URL-encode a file path, reusing the result for recently seen paths."""
+    # An EncodedId compares equal to its encoded value, so it must not be used
+    # as a cache key or it could be confused with a plain path of that name.
+    if isinstance(file_path, utils.EncodedId):
+        return file_path
+    return _encode_path(file_path)
+
+
 class ProjectFile(SaveMixin, ObjectDeleteMixin, RESTObject):
     _id_attr = "file_path"
     _repr_attr = "file_path"
@@ -70,7 +85,6 @@ class ProjectFile(SaveMixin, ObjectDeleteMixin, RESTObject):
         """
         self.branch = branch
         self.commit_message = commit_message
-        self.file_path = utils.EncodedId(self.file_path)
         super().save(**kwargs)
 
     @exc.on_http_error(exc.GitlabDeleteError)
@@ -131,6 +145,7 @@ class ProjectFileManager(GetMixin, CreateMixin, UpdateMixin, DeleteMixin, RESTMa
         Returns:
             The generated RESTObject
         """
+        file_path = _encoded_path(file_path)
         return cast(ProjectFile, GetMixin.get(self, file_path, ref=ref, **kwargs))
 
     @cli.register_custom_action(
@@ -162,7 +177,7 @@ class ProjectFileManager(GetMixin, CreateMixin, UpdateMixin, DeleteMixin, RESTMa
             assert data is not None
         self._create_attrs.validate_attrs(data=data)
         new_data = data.copy()
-        file_path = utils.EncodedId(new_data.pop("file_path"))
+        file_path = _encoded_path(new_data.pop("file_path"))
         path = f"{self.path}/{file_path}"
         server_data = self.gitlab.http_post(path, post_data=new_data, **kwargs)
         if TYPE_CHECKING:
@@ -191,7 +206,7 @@ class ProjectFileManager(GetMixin, CreateMixin, UpdateMixin, DeleteMixin, RESTMa
         """
         new_data = new_data or {}
         data = new_data.copy()
-        file_path = utils.EncodedId(file_path)
+        file_path = _encoded_path(file_path)
         data["file_path"] = file_path
         path = f"{self.path}/{file_path}"
         self._update_attrs.validate_attrs(data=data)
@@ -222,7 +237,7 @@ class ProjectFileManager(GetMixin, CreateMixin, UpdateMixin, DeleteMixin, RESTMa
             GitlabAuthenticationError: If authentication is not correct
             GitlabDeleteError: If the server cannot perform the request
         """
-        file_path = utils.EncodedId(file_path)
+        file_path = _encoded_path(file_path)
         path = f"{self.path}/{file_path}"
         data = {"branch": branch, "commit_message": commit_message}
         self.gitlab.http_delete(path, query_data=data, **kwargs)
@@ -264,7 +279,7 @@ class ProjectFileManager(GetMixin, CreateMixin, UpdateMixin, DeleteMixin, RESTMa
         Returns:
             The file content
         """
-        file_path = utils.EncodedId(file_path)
+        file_path = _encoded_path(file_path)
         path = f"{self.path}/{file_path}/raw"
         query_data = {"ref": ref}
         result = self.gitlab.http_get(
@@ -295,7 +310,7 @@ class ProjectFileManager(GetMixin, CreateMixin, UpdateMixin, DeleteMixin, RESTMa
         Returns:
             A list of commits/lines matching the file
         """
-        file_path = utils.EncodedId(file_path)
+        file_path = _encoded_path(file_path)
         path = f"{self.path}/{file_path}/blame"
         query_data = {"ref": ref}
         result = self.gitlab.http_list(path, query_data, **kwargs)
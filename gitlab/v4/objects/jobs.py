@@ -1,4 +1,17 @@
-from typing import Any, Callable, cast, Dict, Iterator, Optional, TYPE_CHECKING, Union
+import functools
+from typing import (
+    Any,
+    Callable,
+    cast,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TYPE_CHECKING,
+    Union,
+)
 
 import requests
 
@@ -16,6 +29,10 @@ __all__ = [
 
 
 class ProjectJob(RefreshMixin, RESTObject):
+    @functools.cached_property
+    def _base_path(self) -> str:
+        return f"{self.manager.path}/{self.encoded_id}"
+
     @cli.register_custom_action(cls_names="ProjectJob")
     @exc.on_http_error(exc.GitlabJobCancelError)
     def cancel(self, **kwargs: Any) -> Dict[str, Any]:
@@ -28,7 +45,7 @@ class ProjectJob(RefreshMixin, RESTObject):
             GitlabAuthenticationError: If authentication is not correct
             GitlabJobCancelError: If the job could not be canceled
         """
-        path = f"{self.manager.path}/{self.encoded_id}/cancel"
+        path = f"{self._base_path}/cancel"
         result = self.manager.gitlab.http_post(path, **kwargs)
         if TYPE_CHECKING:
             assert isinstance(result, dict)
@@ -46,7 +63,7 @@ class ProjectJob(RefreshMixin, RESTObject):
             GitlabAuthenticationError: If authentication is not correct
             GitlabJobRetryError: If the job could not be retried
         """
-        path = f"{self.manager.path}/{self.encoded_id}/retry"
+        path = f"{self._base_path}/retry"
         result = self.manager.gitlab.http_post(path, **kwargs)
         if TYPE_CHECKING:
             assert isinstance(result, dict)
@@ -64,7 +81,7 @@ class ProjectJob(RefreshMixin, RESTObject):
             GitlabAuthenticationError: If authentication is not correct
             GitlabJobPlayError: If the job could not be triggered
         """
-        path = f"{self.manager.path}/{self.encoded_id}/play"
+        path = f"{self._base_path}/play"
         result = self.manager.gitlab.http_post(path, **kwargs)
         if TYPE_CHECKING:
             assert isinstance(result, dict)
@@ -82,7 +99,7 @@ class ProjectJob(RefreshMixin, RESTObject):
             GitlabAuthenticationError: If authentication is not correct
             GitlabJobEraseError: If the job could not be erased
         """
-        path = f"{self.manager.path}/{self.encoded_id}/erase"
+        path = f"{self._base_path}/erase"
         self.manager.gitlab.http_post(path, **kwargs)
 
     @cli.register_custom_action(cls_names="ProjectJob")
@@ -97,7 +114,7 @@ class ProjectJob(RefreshMixin, RESTObject):
             GitlabAuthenticationError: If authentication is not correct
             GitlabCreateError: If the request could not be performed
         """
-        path = f"{self.manager.path}/{self.encoded_id}/artifacts/keep"
+        path = f"{self._base_path}/artifacts/keep"
         self.manager.gitlab.http_post(path, **kwargs)
 
     @cli.register_custom_action(cls_names="ProjectJob")
@@ -112,7 +129,7 @@ class ProjectJob(RefreshMixin, RESTObject):
             GitlabAuthenticationError: If authentication is not correct
             GitlabDeleteError: If the request could not be performed
         """
-        path = f"{self.manager.path}/{self.encoded_id}/artifacts"
+        path = f"{self._base_path}/artifacts"
         self.manager.gitlab.http_delete(path, **kwargs)
 
     @cli.register_custom_action(cls_names="ProjectJob")
@@ -121,7 +138,7 @@ class ProjectJob(RefreshMixin, RESTObject):
         self,
         streamed: bool = False,
         action: Optional[Callable[..., Any]] = None,
-        chunk_size: int = 1024,
+        chunk_size: int = 65536,
         *,
         iterator: bool = False,
         **kwargs: Any,
@@ -146,7 +163,7 @@ class ProjectJob(RefreshMixin, RESTObject):
         Returns:
             The artifacts if `streamed` is False, None otherwise.
         """
-        path = f"{self.manager.path}/{self.encoded_id}/artifacts"
+        path = f"{self._base_path}/artifacts"
         result = self.manager.gitlab.http_get(
             path, streamed=streamed, raw=True, **kwargs
         )
@@ -163,7 +180,7 @@ class ProjectJob(RefreshMixin, RESTObject):
         path: str,
         streamed: bool = False,
         action: Optional[Callable[..., Any]] = None,
-        chunk_size: int = 1024,
+        chunk_size: int = 65536,
         *,
         iterator: bool = False,
         **kwargs: Any,
@@ -189,7 +206,7 @@ class ProjectJob(RefreshMixin, RESTObject):
         Returns:
             The artifacts if `streamed` is False, None otherwise.
         """
-        path = f"{self.manager.path}/{self.encoded_id}/artifacts/{path}"
+        path = f"{self._base_path}/artifacts/{path}"
         result = self.manager.gitlab.http_get(
             path, streamed=streamed, raw=True, **kwargs
         )
@@ -205,7 +222,7 @@ class ProjectJob(RefreshMixin, RESTObject):
         self,
         streamed: bool = False,
         action: Optional[Callable[..., Any]] = None,
-        chunk_size: int = 1024,
+        chunk_size: int = 65536,
         *,
         iterator: bool = False,
         **kwargs: Any,
@@ -230,7 +247,7 @@ class ProjectJob(RefreshMixin, RESTObject):
         Returns:
             The trace
         """
-        path = f"{self.manager.path}/{self.encoded_id}/trace"
+        path = f"{self._base_path}/trace"
         result = self.manager.gitlab.http_get(
             path, streamed=streamed, raw=True, **kwargs
         )
@@ -248,5 +265,51 @@ class ProjectJobManager(RetrieveMixin, RESTManager):
     _list_filters = ("scope",)
     _types = {"scope": ArrayAttribute}
 
+    _bulk_actions = (
+        "cancel",
+        "retry",
+        "play",
+        "erase",
+        "keep_artifacts",
+        "delete_artifacts",
+    )
+
     def get(self, id: Union[str, int], lazy: bool = False, **kwargs: Any) -> ProjectJob:
         return cast(ProjectJob, super().get(id=id, lazy=lazy, **kwargs))
+
+    def bulk_action(
+        self,
+        ids: Iterable[Union[str, int]],
+        action: str,
+        max_workers: int = 4,
+        **kwargs: Any,
+    ) -> List[Tuple[Union[str, int], Optional[Exception]]]:
+        """Run the same action on several jobs concurrently.
+
+        The requests share the connection pool of the Gitlab session.
+
+        Args:
+            ids: The IDs of the jobs
+            action: One of ``cancel``, ``retry``, ``play``, ``erase``,
+                ``keep_artifacts`` or ``delete_artifacts``
+            max_workers: The maximum number of requests sent at the same time
+            **kwargs: Extra options to send to the server (e.g. sudo)
+
+        Raises:
+            ValueError: If the action is not supported
+
+        Returns:
+            A list of ``(job_id, error)`` tuples in the order of ``ids``, where
+            ``error`` is ``None`` if the action succeeded, or else the exception
+            it raised (e.g. GitlabJobCancelError or a connection error).
+        """
+        if action not in self._bulk_actions:
+            raise ValueError(
+                f"Unsupported job action {action!r}, must be one of: "
+                f"{', '.join(self._bulk_actions)}"
+            )
+
+        def _run(job_id: Union[str, int]) -> None:
+            getattr(self.get(job_id, lazy=True), action)(**kwargs)
+
+        return utils.map_concurrently(_run, ids, max_workers)
@@ -1,3 +1,4 @@
+import functools
 from typing import Any, List, Union
 
 from gitlab import exceptions as exc
@@ -27,7 +28,8 @@ class LDAPGroupManager(RESTManager):
             per_page: Number of items to retrieve per request
             page: ID of the page to return (starts with page 1)
             iterator: If set to True and no pagination option is
-                defined, return a generator instead of a list
+                defined, return a generator instead of a list. The objects
+                are then only built as they are consumed.
             **kwargs: Extra options to send to the server (e.g. sudo)
 
         Returns:
@@ -48,5 +50,5 @@ class LDAPGroupManager(RESTManager):
 
         obj = self.gitlab.http_list(path, **data)
         if isinstance(obj, list):
-            return [self._obj_cls(self, item) for item in obj]
+            return list(map(functools.partial(self._obj_cls, self), obj))
         return RESTObjectList(self, self._obj_cls, obj)
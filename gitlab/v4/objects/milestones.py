@@ -1,11 +1,28 @@
-from typing import Any, cast, TYPE_CHECKING, Union
+import functools
+from typing import (
+    Any,
+    cast,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    overload,
+    Tuple,
+    Type,
+    TYPE_CHECKING,
+    TypeVar,
+    Union,
+)
 
-from gitlab import cli
+from gitlab import cli, client
 from gitlab import exceptions as exc
-from gitlab import types
+from gitlab import types, utils
 from gitlab.base import RESTManager, RESTObject, RESTObjectList
 from gitlab.mixins import (
     CRUDMixin,
+    GetMixin,
     ObjectDeleteMixin,
     PromoteMixin,
     SaveMixin,
@@ -27,19 +44,137 @@ __all__ = [
     "ProjectMilestoneManager",
 ]
 
+if TYPE_CHECKING:
+    # When running mypy we use these as the base classes
+    _RestManagerBase = GetMixin
+    _RestObjectBase = RESTObject
+else:
+    _RestManagerBase = object
+    _RestObjectBase = object
 
-class GroupMilestone(SaveMixin, ObjectDeleteMixin, RESTObject):
-    _repr_attr = "title"
+_IssueT = TypeVar("_IssueT", GroupIssue, ProjectIssue)
+
+# Largest page size accepted by the GitLab API
+_MAX_PER_PAGE = 100
+
+
+def _page_size_kwargs(
+    per_page: Optional[int], kwargs: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Default the page size of a milestone sub-resource listing.
+
+    The listings are iterated page by page, so use the largest page size unless
+    a page size is configured or a specific page is requested.
+    """
+    if "page" in kwargs or "per_page" in kwargs:
+        return kwargs
+    return {**kwargs, "per_page": per_page or _MAX_PER_PAGE}
+
+
+class _MilestoneMixin(_RestObjectBase):
+    _issue_cls: Type[RESTObject]
+    _issue_manager_cls: Type[RESTManager]
+    _merge_request_cls: Type[RESTObject]
+    _merge_request_manager_cls: Type[RESTManager]
+
+    @functools.cached_property
+    def _etag_cache(self) -> Dict[str, Any]:
+        """Recently fetched listing pages, kept when revalidating by ETag."""
+        return {}
+
+    @functools.cached_property
+    def _issues_path(self) -> str:
+        return f"{self.manager.path}/{self.encoded_id}/issues"
+
+    @functools.cached_property
+    def _merge_requests_path(self) -> str:
+        return f"{self.manager.path}/{self.encoded_id}/merge_requests"
+
+    @functools.cached_property
+    def _issues_manager(self) -> RESTManager:
+        # FIXME(gpocentek): the computed manager path is not correct
+        return self._issue_manager_cls(self.manager.gitlab, parent=self.manager._parent)
+
+    @functools.cached_property
+    def _merge_requests_manager(self) -> RESTManager:
+        # FIXME(gpocentek): the computed manager path is not correct
+        return self._merge_request_manager_cls(
+            self.manager.gitlab, parent=self.manager._parent
+        )
+
+    def _list(
+        self,
+        path: str,
+        manager: RESTManager,
+        obj_cls: Type[RESTObject],
+        as_dicts: bool,
+        revalidate: bool,
+        kwargs: Dict[str, Any],
+    ) -> Union[RESTObjectList, client.GitlabList]:
+        gl = self.manager.gitlab
+        kwargs = _page_size_kwargs(gl.per_page, kwargs)
+        get_all = kwargs.pop("get_all", None)
+        if get_all is None:
+            get_all = kwargs.pop("all", None)
+        # http_list() returns a plain list rather than a generator when a page
+        # is requested, so build the GitlabList here: a requested page is
+        # fetched on its own, otherwise the pagination links are followed
+        data_list = client.GitlabList(
+            gl,
+            path,
+            {},
+            get_next="page" not in kwargs or get_all is True,
+            etag_cache=self._etag_cache if revalidate else None,
+            **kwargs,
+        )
+        if as_dicts:
+            return data_list
+        return RESTObjectList(manager, obj_cls, data_list)
+
+    @overload
+    def issues(
+        self,
+        as_dicts: Literal[False] = False,
+        revalidate: bool = False,
+        **kwargs: Any,
+    ) -> RESTObjectList: ...
 
-    @cli.register_custom_action(cls_names="GroupMilestone")
+    @overload
+    def issues(
+        self,
+        as_dicts: Literal[True],
+        revalidate: bool = False,
+        **kwargs: Any,
+    ) -> client.GitlabList: ...
+
+    @overload
+    def issues(
+        self,
+        as_dicts: bool = False,
+        revalidate: bool = False,
+        **kwargs: Any,
+    ) -> Union[RESTObjectList, client.GitlabList]: ...
+
+    @cli.register_custom_action(cls_names=("GroupMilestone", "ProjectMilestone"))
     @exc.on_http_error(exc.GitlabListError)
-    def issues(self, **kwargs: Any) -> RESTObjectList:
+    def issues(
+        self,
+        as_dicts: bool = False,
+        revalidate: bool = False,
+        **kwargs: Any,
+    ) -> Union[RESTObjectList, client.GitlabList]:
         """List issues related to this milestone.
 
         Args:
             all: If True, return all the items, without pagination
-            per_page: Number of items to retrieve per request
+            per_page: Number of items to retrieve per request (defaults to
+                the configured ``per_page``, or else 100, the server maximum)
             page: ID of the page to return (starts with page 1)
+            as_dicts: If True, yield the raw dicts returned by the server
+                instead of building an object for each item
+            revalidate: If True, keep the fetched pages on this milestone object
+                and request them again with ``If-None-Match``, reusing those
+                the server reports unchanged
             **kwargs: Extra options to send to the server (e.g. sudo)
 
         Raises:
@@ -47,26 +182,62 @@ class GroupMilestone(SaveMixin, ObjectDeleteMixin, RESTObject):
             GitlabListError: If the list could not be retrieved
 
         Returns:
-            The list of issues
+            The list of issues, or an iterator over the raw dicts if `as_dicts`
+            is True
         """
+        return self._list(
+            self._issues_path,
+            self._issues_manager,
+            self._issue_cls,
+            as_dicts,
+            revalidate,
+            kwargs,
+        )
 
-        path = f"{self.manager.path}/{self.encoded_id}/issues"
-        data_list = self.manager.gitlab.http_list(path, iterator=True, **kwargs)
-        if TYPE_CHECKING:
-            assert isinstance(data_list, RESTObjectList)
-        manager = GroupIssueManager(self.manager.gitlab, parent=self.manager._parent)
-        # FIXME(gpocentek): the computed manager path is not correct
-        return RESTObjectList(manager, GroupIssue, data_list)
+    @overload
+    def merge_requests(
+        self,
+        as_dicts: Literal[False] = False,
+        revalidate: bool = False,
+        **kwargs: Any,
+    ) -> RESTObjectList: ...
+
+    @overload
+    def merge_requests(
+        self,
+        as_dicts: Literal[True],
+        revalidate: bool = False,
+        **kwargs: Any,
+    ) -> client.GitlabList: ...
 
-    @cli.register_custom_action(cls_names="GroupMilestone")
+    @overload
+    def merge_requests(
+        self,
+        as_dicts: bool = False,
+        revalidate: bool = False,
+        **kwargs: Any,
+    ) -> Union[RESTObjectList, client.GitlabList]: ...
+
+    @cli.register_custom_action(cls_names=("GroupMilestone", "ProjectMilestone"))
     @exc.on_http_error(exc.GitlabListError)
-    def merge_requests(self, **kwargs: Any) -> RESTObjectList:
+    def merge_requests(
+        self,
+        as_dicts: bool = False,
+        revalidate: bool = False,
+        **kwargs: Any,
+    ) -> Union[RESTObjectList, client.GitlabList]:
         """List the merge requests related to this milestone.
 
         Args:
             all: If True, return all the items, without pagination
-            per_page: Number of items to retrieve per request
+            per_page: Number of items to retrieve per request (defaults to
+                the configured ``per_page``, or else 100, the server maximum)
             page: ID of the page to return (starts with page 1)
+            as_dicts: If True, yield the raw dicts returned by the server
+                instead of building an object for each item
+            revalidate: If True, keep the fetched pages on this milestone object
+                and request them again with ``If-None-Match``, reusing those
+                the server reports unchanged
             **kwargs: Extra options to send to the server (e.g. sudo)
 
         Raises:
@@ -74,18 +245,60 @@ class GroupMilestone(SaveMixin, ObjectDeleteMixin, RESTObject):
             GitlabListError: If the list could not be retrieved
 
         Returns:
-            The list of merge requests
+            The list of merge requests, or an iterator over the raw dicts if
+            `as_dicts` is True
         """
-        path = f"{self.manager.path}/{self.encoded_id}/merge_requests"
-        data_list = self.manager.gitlab.http_list(path, iterator=True, **kwargs)
-        if TYPE_CHECKING:
-            assert isinstance(data_list, RESTObjectList)
-        manager = GroupIssueManager(self.manager.gitlab, parent=self.manager._parent)
-        # FIXME(gpocentek): the computed manager path is not correct
-        return RESTObjectList(manager, GroupMergeRequest, data_list)
+        return self._list(
+            self._merge_requests_path,
+            self._merge_requests_manager,
+            self._merge_request_cls,
+            as_dicts,
+            revalidate,
+            kwargs,
+        )
+
+
+class _MilestoneManagerMixin(Generic[_IssueT], _RestManagerBase):
+    def issues_for(
+        self,
+        milestone_ids: Iterable[Union[str, int]],
+        max_workers: int = 4,
+        **kwargs: Any,
+    ) -> List[Tuple[Union[str, int], Union[List[_IssueT], Exception]]]:
+        """List the issues of several milestones concurrently.
+
+        Each milestone's issues are fetched completely, following pagination,
+        and the listings run in parallel over the Gitlab session's connection
+        pool.
+
+        Args:
+            milestone_ids: The IDs of the milestones
+            max_workers: The maximum number of listings fetched at the same time
+            **kwargs: Extra options to send to the server (e.g. sudo)
+
+        Returns:
+            A list of ``(milestone_id, issues)`` tuples in the order of
+            ``milestone_ids``, where ``issues`` is the error raised if the
+            listing failed.
+        """
+
+        def _fetch(milestone_id: Union[str, int]) -> List[_IssueT]:
+            milestone = self.get(milestone_id, lazy=True)
+            return cast(List[_IssueT], list(milestone.issues(**kwargs)))
+
+        return utils.map_concurrently(_fetch, milestone_ids, max_workers)
 
 
-class GroupMilestoneManager(CRUDMixin, RESTManager):
+class GroupMilestone(_MilestoneMixin, SaveMixin, ObjectDeleteMixin, RESTObject):
+    _repr_attr = "title"
+    _issue_cls = GroupIssue
+    _issue_manager_cls = GroupIssueManager
+    _merge_request_cls = GroupMergeRequest
+    # FIXME: group merge requests are still attached to an issue manager
+    _merge_request_manager_cls = GroupIssueManager
+
+
+class GroupMilestoneManager(_MilestoneManagerMixin[GroupIssue], CRUDMixin, RESTManager):
     _path = "/groups/{group_id}/milestones"
     _obj_cls = GroupMilestone
     _from_parent_attrs = {"group_id": "id"}
@@ -104,67 +317,20 @@ class GroupMilestoneManager(CRUDMixin, RESTManager):
         return cast(GroupMilestone, super().get(id=id, lazy=lazy, **kwargs))
 
 
-class ProjectMilestone(PromoteMixin, SaveMixin, ObjectDeleteMixin, RESTObject):
+class ProjectMilestone(
+    _MilestoneMixin, PromoteMixin, SaveMixin, ObjectDeleteMixin, RESTObject
+):
     _repr_attr = "title"
     _update_method = UpdateMethod.POST
-
-    @cli.register_custom_action(cls_names="ProjectMilestone")
-    @exc.on_http_error(exc.GitlabListError)
-    def issues(self, **kwargs: Any) -> RESTObjectList:
-        """List issues related to this milestone.
-
-        Args:
-            all: If True, return all the items, without pagination
-            per_page: Number of items to retrieve per request
-            page: ID of the page to return (starts with page 1)
-            **kwargs: Extra options to send to the server (e.g. sudo)
-
-        Raises:
-            GitlabAuthenticationError: If authentication is not correct
-            GitlabListError: If the list could not be retrieved
-
-        Returns:
-            The list of issues
-        """
-
-        path = f"{self.manager.path}/{self.encoded_id}/issues"
-        data_list = self.manager.gitlab.http_list(path, iterator=True, **kwargs)
-        if TYPE_CHECKING:
-            assert isinstance(data_list, RESTObjectList)
-        manager = ProjectIssueManager(self.manager.gitlab, parent=self.manager._parent)
-        # FIXME(gpocentek): the computed manager path is not correct
-        return RESTObjectList(manager, ProjectIssue, data_list)
-
-    @cli.register_custom_action(cls_names="ProjectMilestone")
-    @exc.on_http_error(exc.GitlabListError)
-    def merge_requests(self, **kwargs: Any) -> RESTObjectList:
-        """List the merge requests related to this milestone.
-
-        Args:
-            all: If True, return all the items, without pagination
-            per_page: Number of items to retrieve per request
-            page: ID of the page to return (starts with page 1)
-            **kwargs: Extra options to send to the server (e.g. sudo)
-
-        Raises:
-            GitlabAuthenticationError: If authentication is not correct
-            GitlabListError: If the list could not be retrieved
-
-        Returns:
-            The list of merge requests
-        """
-        path = f"{self.manager.path}/{self.encoded_id}/merge_requests"
-        data_list = self.manager.gitlab.http_list(path, iterator=True, **kwargs)
-        if TYPE_CHECKING:
-            assert isinstance(data_list, RESTObjectList)
-        manager = ProjectMergeRequestManager(
-            self.manager.gitlab, parent=self.manager._parent
-        )
-        # FIXME(gpocentek): the computed manager path is not correct
-        return RESTObjectList(manager, ProjectMergeRequest, data_list)
+    _issue_cls = ProjectIssue
+    _issue_manager_cls = ProjectIssueManager
+    _merge_request_cls = ProjectMergeRequest
+    _merge_request_manager_cls = ProjectMergeRequestManager
 
 
-class ProjectMilestoneManager(CRUDMixin, RESTManager):
+class ProjectMilestoneManager(
+    _MilestoneManagerMixin[ProjectIssue], CRUDMixin, RESTManager
+):
     _path = "/projects/{project_id}/milestones"
     _obj_cls = ProjectMilestone
     _from_parent_attrs = {"project_id": "id"}
@@ -187,6 +187,7 @@ def test_list_mixin(gl):
     mgr = M(gl)
     obj_list = mgr.list(iterator=True)
     assert isinstance(obj_list, base.RESTObjectList)
+    assert not hasattr(obj_list, "__dict__")
     assert obj_list.current_page == 1
     assert obj_list.prev_page is None
     assert obj_list.next_page == 2
@@ -5,8 +5,10 @@ GitLab API: https://docs.gitlab.com/ee/api/jobs.html
 from functools import partial
 
 import pytest
+import requests
 import responses
 
+from gitlab import exceptions as exc
 from gitlab.v4.objects import ProjectJob
 
 failed_job_content = {
@@ -85,6 +87,26 @@ def resp_retry_job():
         yield rsps
 
 
+@pytest.fixture
+def resp_bulk_cancel_jobs():
+    with responses.RequestsMock() as rsps:
+        rsps.add(
+            method=responses.POST,
+            url="http://localhost/api/v4/projects/1/jobs/1/cancel",
+            json=failed_job_content,
+            content_type="application/json",
+            status=201,
+        )
+        rsps.add(
+            method=responses.POST,
+            url="http://localhost/api/v4/projects/1/jobs/2/cancel",
+            json={"message": "403 Forbidden"},
+            content_type="application/json",
+            status=403,
+        )
+        yield rsps
+
+
 @pytest.fixture
 def resp_list_job():
     urls = [
@@ -145,6 +167,41 @@ def test_retry_project_job(project, resp_retry_job):
     assert output["ref"] == "main"
 
 
+def test_bulk_cancel_project_jobs(project, resp_bulk_cancel_jobs):
+    results = project.jobs.bulk_action([1, 2], "cancel", max_workers=2)
+
+    assert [job_id for job_id, _ in results] == [1, 2]
+    assert results[0][1] is None
+    assert isinstance(results[1][1], exc.GitlabJobCancelError)
+
+
+@responses.activate
+def test_bulk_action_returns_connection_errors(project):
+    responses.add(
+        method=responses.POST,
+        url="http://localhost/api/v4/projects/1/jobs/1/cancel",
+        json=failed_job_content,
+        content_type="application/json",
+        status=201,
+    )
+    responses.add(
+        method=responses.POST,
+        url="http://localhost/api/v4/projects/1/jobs/2/cancel",
+        body=requests.ConnectionError("connection dropped"),
+    )
+
+    results = project.jobs.bulk_action([1, 2], "cancel", max_workers=2)
+
+    assert [job_id for job_id, _ in results] == [1, 2]
+    assert results[0][1] is None
+    assert isinstance(results[1][1], requests.ConnectionError)
+
+
+def test_bulk_action_unsupported_action(project):
+    with pytest.raises(ValueError):
+        project.jobs.bulk_action([1], "delete")
+
+
 def test_list_project_job(project, resp_list_job):
     failed_jobs = project.jobs.list(scope="failed")
     success_jobs = project.jobs.list(scope="success")
@@ -0,0 +1,40 @@
+"""
+GitLab API: https://docs.gitlab.com/ee/api/groups.html
+"""
+
+import pytest
+import responses
+
+from gitlab.base import RESTObjectList
+from gitlab.v4.objects import LDAPGroup
+
+ldap_groups_content = [
+    {"cn": "group1", "description": "Group 1"},
+    {"cn": "group2", "description": "Group 2"},
+]
+
+
+@pytest.fixture
+def resp_list_ldap_groups():
+    with responses.RequestsMock() as rsps:
+        rsps.add(
+            method=responses.GET,
+            url="http://localhost/api/v4/ldap/ldapmain/groups",
+            json=ldap_groups_content,
+            content_type="application/json",
+            status=200,
+        )
+        yield rsps
+
+
+def test_list_ldap_groups(gl, resp_list_ldap_groups):
+    groups = gl.ldapgroups.list(provider="ldapmain")
+    assert isinstance(groups, list)
+    assert isinstance(groups[0], LDAPGroup)
+    assert [group.cn for group in groups] == ["group1", "group2"]
+
+
+def test_list_ldap_groups_iterator(gl, resp_list_ldap_groups):
+    groups = gl.ldapgroups.list(provider="ldapmain", iterator=True)
+    assert isinstance(groups, RESTObjectList)
+    assert next(groups).cn == "group1"
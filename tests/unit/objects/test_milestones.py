@@ -0,0 +1,271 @@
+"""
+GitLab API:
+https://docs.gitlab.com/ee/api/milestones.html
+https://docs.gitlab.com/ee/api/group_milestones.html
+"""
+
+import json
+import re
+
+import pytest
+import requests
+import responses
+
+from gitlab import GitlabList, GitlabListError, utils
+from gitlab.base import RESTObject, RESTObjectList
+from gitlab.v4.objects import (
+    GroupIssue,
+    GroupMergeRequest,
+    GroupMilestone,
+    ProjectIssue,
+    ProjectMergeRequest,
+    ProjectMilestone,
+)
+
+issues_content = [{"id": 1, "iid": 1, "title": "issue 1"}]
+merge_requests_content = [{"id": 2, "iid": 2, "title": "merge request 2"}]
+
+
+@pytest.fixture
+def resp_milestone_sub_resources():
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as rsps:
+        rsps.add(
+            method=responses.GET,
+            url=re.compile(
+                r"http://localhost/api/v4/(groups|projects)/1/milestones/1/issues"
+            ),
+            json=issues_content,
+            content_type="application/json",
+            status=200,
+        )
+        rsps.add(
+            method=responses.GET,
+            url=re.compile(
+                r"http://localhost/api/v4/(groups|projects)/1/milestones/1/merge_requests"
+            ),
+            json=merge_requests_content,
+            content_type="application/json",
+            status=200,
+        )
+        yield rsps
+
+
+@pytest.mark.parametrize(
+    "parent_fixture,method,expected_cls",
+    [
+        ("group", "issues", GroupIssue),
+        ("group", "merge_requests", GroupMergeRequest),
+        ("project", "issues", ProjectIssue),
+        ("project", "merge_requests", ProjectMergeRequest),
+    ],
+)
+def test_list_milestone_sub_resources(
+    request, resp_milestone_sub_resources, parent_fixture, method, expected_cls
+):
+    parent = request.getfixturevalue(parent_fixture)
+    milestone = parent.milestones.get(1, lazy=True)
+
+    items = getattr(milestone, method)()
+    assert isinstance(items, RESTObjectList)
+
+    item = next(items)
+    assert isinstance(item, expected_cls)
+    assert item.iid in (1, 2)
+    assert resp_milestone_sub_resources.calls[0].request.params == {"per_page": "100"}
+
+
+@pytest.mark.parametrize("kwargs", [{}, {"page": 1}])
+@pytest.mark.parametrize("method", ["issues", "merge_requests"])
+def test_list_milestone_sub_resources_as_dicts(
+    project, resp_milestone_sub_resources, method, kwargs
+):
+    milestone = project.milestones.get(1, lazy=True)
+
+    items = getattr(milestone, method)(as_dicts=True, **kwargs)
+    assert isinstance(items, GitlabList)
+    assert isinstance(next(items), dict)
+
+
+@responses.activate
+def test_list_milestones_by_iids(project):
+    iids = list(range(1, 1001))
+    responses.add(
+        method=responses.GET,
+        url="http://localhost/api/v4/projects/1/milestones",
+        json=[],
+        match=[
+            responses.matchers.query_param_matcher(
+                {"iids[]": [str(iid) for iid in iids]}
+            )
+        ],
+    )
+
+    assert project.milestones.list(iids=iids) == []
+
+
+@pytest.mark.parametrize("parent_fixture", ["group", "project"])
+def test_milestone_has_no_extra_state_before_listing(request, parent_fixture):
+    manager = request.getfixturevalue(parent_fixture).milestones
+    milestone = manager.get(1, lazy=True)
+    plain = RESTObject(manager, {"id": 1}, lazy=True)
+
+    assert milestone.__dict__.keys() == plain.__dict__.keys()
+
+
+def test_milestone_reuses_sub_resource_manager(project, resp_milestone_sub_resources):
+    milestone = project.milestones.get(1, lazy=True)
+
+    first = next(milestone.issues())
+    second = next(milestone.issues())
+    assert first.manager is second.manager
+    assert [
+        call.request.url.split("?")[0] for call in resp_milestone_sub_resources.calls
+    ] == ["http://localhost/api/v4/projects/1/milestones/1/issues"] * 2
+
+
+def test_list_milestone_issues_keeps_requested_page(
+    project, resp_milestone_sub_resources
+):
+    milestone = project.milestones.get(1, lazy=True)
+
+    issues = list(milestone.issues(page=2))
+    assert [issue.iid for issue in issues] == [1]
+    assert resp_milestone_sub_resources.calls[0].request.params == {"page": "2"}
+
+
+def test_milestone_issues_use_fast_json_decoder(
+    project, resp_milestone_sub_resources, monkeypatch
+):
+    decoded = []
+
+    def fake_loads(content):
+        decoded.append(content)
+        return json.loads(content)
+
+    monkeypatch.setattr(utils, "_json_loads", fake_loads)
+    milestone = project.milestones.get(1, lazy=True)
+
+    assert [issue.title for issue in milestone.issues()] == ["issue 1"]
+    assert len(decoded) == 1
+
+
+@responses.activate
+def test_milestone_issues_revalidated_with_etag(project):
+    url = "http://localhost/api/v4/projects/1/milestones/1/issues"
+    responses.add(
+        method=responses.GET,
+        url=url,
+        json=issues_content,
+        headers={"ETag": 'W/"issues"'},
+        content_type="application/json",
+        status=200,
+    )
+    responses.add(
+        method=responses.GET,
+        url=url,
+        status=304,
+        match=[responses.matchers.header_matcher({"If-None-Match": 'W/"issues"'})],
+    )
+    milestone = project.milestones.get(1, lazy=True)
+
+    issues = list(milestone.issues(as_dicts=True, revalidate=True))
+    assert [issue["iid"] for issue in issues] == [1]
+    issues[0]["iid"] = 42
+
+    issues = list(milestone.issues(as_dicts=True, revalidate=True))
+    assert [issue["iid"] for issue in issues] == [1]
+    assert len(responses.calls) == 2
+    assert responses.calls[1].response.status_code == 304
+
+
+@responses.activate
+def test_milestone_issues_revalidation_keeps_extra_headers(project):
+    url = "http://localhost/api/v4/projects/1/milestones/1/issues"
+    responses.add(
+        method=responses.GET,
+        url=url,
+        json=issues_content,
+        headers={"ETag": 'W/"issues"'},
+        content_type="application/json",
+        status=200,
+    )
+    responses.add(
+        method=responses.GET,
+        url=url,
+        status=304,
+        match=[
+            responses.matchers.header_matcher(
+                {"If-None-Match": 'W/"issues"', "X-Custom": "1"}
+            )
+        ],
+    )
+    milestone = project.milestones.get(1, lazy=True)
+
+    for _ in range(2):
+        issues = milestone.issues(revalidate=True, extra_headers={"X-Custom": "1"})
+        assert [issue.iid for issue in issues] == [1]
+    assert responses.calls[1].response.status_code == 304
+
+
+@responses.activate
+def test_milestone_issues_not_revalidated_by_default(project):
+    responses.add(
+        method=responses.GET,
+        url="http://localhost/api/v4/projects/1/milestones/1/issues",
+        json=issues_content,
+        headers={"ETag": 'W/"issues"'},
+        content_type="application/json",
+        status=200,
+    )
+    milestone = project.milestones.get(1, lazy=True)
+
+    assert [issue.iid for issue in milestone.issues()] == [1]
+    assert [issue.iid for issue in milestone.issues()] == [1]
+    assert all("If-None-Match" not in call.request.headers for call in responses.calls)
+
+
+def test_milestone_issues_for_returns_errors(project, resp_milestone_sub_resources):
+    resp_milestone_sub_resources.add(
+        method=responses.GET,
+        url="http://localhost/api/v4/projects/1/milestones/2/issues",
+        json={"message": "404 Not Found"},
+        status=404,
+    )
+    resp_milestone_sub_resources.add(
+        method=responses.GET,
+        url="http://localhost/api/v4/projects/1/milestones/3/issues",
+        body=requests.ConnectionError("connection dropped"),
+    )
+
+    issues = project.milestones.issues_for([1, 2, 3], max_workers=2)
+
+    assert [milestone_id for milestone_id, _ in issues] == [1, 2, 3]
+    assert [issue.iid for issue in issues[0][1]] == [1]
+    assert isinstance(issues[1][1], GitlabListError)
+    assert isinstance(issues[2][1], requests.ConnectionError)
+
+
+@pytest.mark.parametrize(
+    "parent_fixture,expected_cls",
+    [("group", GroupIssue), ("project", ProjectIssue)],
+)
+def test_milestone_issues_for(
+    request, resp_milestone_sub_resources, parent_fixture, expected_cls
+):
+    parent = request.getfixturevalue(parent_fixture)
+
+    [(milestone_id, issues)] = parent.milestones.issues_for([1])
+
+    assert milestone_id == 1
+    assert isinstance(issues[0], expected_cls)
+    assert [issue.iid for issue in issues] == [1]
+
+
+@pytest.mark.parametrize("obj_cls", [GroupMilestone, ProjectMilestone])
+@pytest.mark.parametrize("method", ["issues", "merge_requests"])
+def test_milestone_sub_resource_methods_are_wrapped_once(obj_cls, method):
+    # register_custom_action returns the method itself, so on_http_error's
+    # wrapper is the only extra frame per call
+    wrapped = getattr(obj_cls, method).__wrapped__
+
+    assert not hasattr(wrapped, "__wrapped__")
@@ -5,8 +5,11 @@ GitLab API: https://docs.gitlab.com/ee/api/container_registry.html
 import re
 
 import pytest
+import requests
 import responses
+from responses import matchers
 
+from gitlab import exceptions as exc
 from gitlab.v4.objects import ProjectRegistryRepository, RegistryRepository
 
 repositories_content = [
@@ -70,6 +73,26 @@ def resp_delete_registry_repository():
         yield rsps
 
 
+@pytest.fixture
+def resp_delete_registry_tags_in_bulk():
+    url = "http://localhost/api/v4/projects/1/registry/repositories/1/tags"
+    with responses.RequestsMock() as rsps:
+        rsps.add(
+            method=responses.DELETE,
+            url=url,
+            match=[matchers.query_param_matcher({"name_regex_delete": "v.+"})],
+            status=202,
+        )
+        rsps.add(
+            method=responses.DELETE,
+            url=url,
+            match=[matchers.query_param_matcher({"name_regex_delete": "["})],
+            json={"message": "invalid regex"},
+            status=400,
+        )
+        yield rsps
+
+
 def test_list_group_registry_repositories(group, resp_list_registry_repositories):
     repositories = group.registry_repositories.list()
     assert isinstance(repositories[0], ProjectRegistryRepository)
@@ -90,3 +113,60 @@ def test_get_registry_repository(gl, resp_get_registry_repository):
     repository = gl.registry_repositories.get(1)
     assert isinstance(repository, RegistryRepository)
     assert repository.id == 1
+
+
+def test_delete_registry_tags_in_bulk_many(project, resp_delete_registry_tags_in_bulk):
+    repository = ProjectRegistryRepository(
+        project.repositories, {"id": 1, "project_id": 1}
+    )
+    specs = [{"name_regex_delete": "v.+"}, {"name_regex_delete": "["}]
+    results = repository.tags.delete_in_bulk_many(specs, max_workers=2)
+
+    assert [spec for spec, _ in results] == specs
+    assert results[0][1] is None
+    assert isinstance(results[1][1], exc.GitlabDeleteError)
+    assert results[1][1].response_code == 400
+
+
+@responses.activate
+def test_delete_registry_tags_in_bulk_many_returns_connection_errors(project):
+    url = "http://localhost/api/v4/projects/1/registry/repositories/1/tags"
+    responses.add(
+        method=responses.DELETE,
+        url=url,
+        match=[matchers.query_param_matcher({"name_regex_delete": "v.+"})],
+        status=202,
+    )
+    responses.add(
+        method=responses.DELETE,
+        url=url,
+        match=[matchers.query_param_matcher({"name_regex_delete": "dev-.+"})],
+        body=requests.ConnectionError("connection dropped"),
+    )
+    repository = ProjectRegistryRepository(
+        project.repositories, {"id": 1, "project_id": 1}
+    )
+    specs = [{"name_regex_delete": "v.+"}, {"name_regex_delete": "dev-.+"}]
+    results = repository.tags.delete_in_bulk_many(specs, max_workers=2)
+
+    assert [spec for spec, _ in results] == specs
+    assert results[0][1] is None
+    assert isinstance(results[1][1], requests.ConnectionError)
+
+
+@pytest.mark.parametrize(
+    "specs,kwargs",
+    [
+        ([{"name_regex_delete": "v.+"}, {"keep_n": 1}], {}),
+        ([{"name_regex_delete": "v.+", "keep_n": 1}], {"keep_n": 2}),
+    ],
+)
+@responses.activate
+def test_delete_registry_tags_in_bulk_many_checks_specs_first(project, specs, kwargs):
+    repository = ProjectRegistryRepository(
+        project.repositories, {"id": 1, "project_id": 1}
+    )
+
+    with pytest.raises(ValueError):
+        repository.tags.delete_in_bulk_many(specs, **kwargs)
+    assert not responses.calls
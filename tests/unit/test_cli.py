@@ -55,6 +55,21 @@ def test_cls_to_gitlab_resource(class_name, expected_gitlab_resource):
     assert cli.cls_to_gitlab_resource(TestClass) == expected_gitlab_resource
 
 
+def test_register_custom_action_returns_function(monkeypatch):
+    monkeypatch.setattr(cli, "custom_actions", {})
+
+    def do_something(self):
+        pass
+
+    decorated = cli.register_custom_action(cls_names="FakeObject", required=("foo",))(
+        do_something
+    )
+
+    assert decorated is do_something
+    assert cli.custom_actions["FakeObject"]["do-something"].in_object is True
+    assert cli.custom_actions["FakeObject"]["do-something"].required == ("foo",)
+
+
 @pytest.mark.parametrize(
     "message,error,expected",
     [
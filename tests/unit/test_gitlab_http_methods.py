@@ -1,11 +1,18 @@
 import copy
+import re
 import warnings
 
 import pytest
 import requests
 import responses
 
-from gitlab import GitlabHttpError, GitlabList, GitlabParsingError, RedirectError
+from gitlab import (
+    client,
+    GitlabHttpError,
+    GitlabList,
+    GitlabParsingError,
+    RedirectError,
+)
 from gitlab.const import RETRYABLE_TRANSIENT_ERROR_CODES
 from tests.unit import helpers
 
@@ -542,6 +549,69 @@ def test_list_request(gl):
     assert responses.assert_call_count(url, 3) is True
 
 
+@responses.activate
+def test_list_request_etag_cache(gl):
+    url = "http://localhost/api/v4/projects"
+    responses.add(
+        method=responses.GET,
+        url=url,
+        json=[{"name": "project1"}],
+        headers={"ETag": 'W/"abc"', "X-Total": "1"},
+        status=200,
+    )
+    responses.add(
+        method=responses.GET,
+        url=url,
+        status=304,
+        match=[responses.matchers.header_matcher({"If-None-Match": 'W/"abc"'})],
+    )
+    etag_cache = {}
+
+    result = gl.http_list("/projects", iterator=True, etag_cache=etag_cache)
+    assert list(result) == [{"name": "project1"}]
+    assert len(etag_cache) == 1
+
+    result = gl.http_list("/projects", iterator=True, etag_cache=etag_cache)
+    assert list(result) == [{"name": "project1"}]
+    assert result.total == 1
+    assert "If-None-Match" not in responses.calls[0].request.headers
+    assert responses.calls[1].request.headers["If-None-Match"] == 'W/"abc"'
+    assert responses.calls[1].request.url == url
+
+
+@responses.activate
+def test_list_request_etag_cache_is_bounded(gl):
+    responses.add(
+        method=responses.GET,
+        url=re.compile(r"http://localhost/api/v4/projects/\d+/issues"),
+        json=[],
+        headers={"ETag": 'W/"abc"'},
+        status=200,
+    )
+    etag_cache = {}
+
+    for project_id in range(client._ETAG_CACHE_MAX_PAGES + 1):
+        list(
+            gl.http_list(
+                f"/projects/{project_id}/issues",
+                iterator=True,
+                etag_cache=etag_cache,
+            )
+        )
+
+    assert len(etag_cache) == client._ETAG_CACHE_MAX_PAGES
+    assert not any("/projects/0/" in key for key in etag_cache)
+
+
+@responses.activate
+def test_http_request_304_without_condition_raises(gl):
+    url = "http://localhost/api/v4/projects"
+    responses.add(method=responses.GET, url=url, status=304)
+
+    with pytest.raises(GitlabHttpError):
+        gl.http_request("get", "/projects")
+
+
 @responses.activate
 def test_list_request_page_and_iterator(gl):
     response_dict = copy.deepcopy(large_list_response)
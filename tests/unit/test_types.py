@@ -38,6 +38,15 @@ class TestRequiredOptional:
         with pytest.raises(AttributeError, match="Missing attributes: required1"):
             rq.validate_attrs(data=data)
 
+    def test_validate_attrs_required_excludes(self):
+        data = {"required2": 2}
+        rq = types.RequiredOptional(required=("required1", "required2", "required3"))
+        rq.validate_attrs(data=data, excludes=["required1", "required3"])
+        with pytest.raises(
+            AttributeError, match="Missing attributes: required1, required3"
+        ):
+            rq.validate_attrs(data=data)
+
     def test_validate_attrs_exclusive(self):
         data = {"exclusive1": 1, "optional1": 1}
         rq = types.RequiredOptional(exclusive=("exclusive1", "exclusive2"))
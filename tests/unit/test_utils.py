@@ -1,12 +1,13 @@
 import json
 import logging
+import urllib.parse
 import warnings
 
 import pytest
 import requests
 import responses
 
-from gitlab import types, utils
+from gitlab import exceptions, types, utils
 
 
 @pytest.mark.parametrize(
@@ -42,6 +43,58 @@ def test_response_content(capsys):
     assert "test" in captured.out
 
 
+@responses.activate
+def test_response_json():
+    responses.add(
+        method="GET",
+        url="https://example.com",
+        status=200,
+        json={"id": 1},
+    )
+
+    resp = requests.get("https://example.com")
+    assert utils.response_json(resp) == {"id": 1}
+
+
+@responses.activate
+def test_response_json_uses_fast_decoder(monkeypatch):
+    responses.add(
+        method="GET",
+        url="https://example.com",
+        status=200,
+        json={"id": 1},
+    )
+    decoded = []
+
+    def fake_loads(content):
+        decoded.append(content)
+        return json.loads(content)
+
+    monkeypatch.setattr(utils, "_json_loads", fake_loads)
+    resp = requests.get("https://example.com")
+    assert utils.response_json(resp) == {"id": 1}
+    assert decoded == [b'{"id": 1}']
+
+
+def test_map_concurrently_returns_errors():
+    errors = {
+        2: exceptions.GitlabError("boom"),
+        3: requests.ConnectionError("connection dropped"),
+    }
+
+    def double(item):
+        if item in errors:
+            raise errors[item]
+        return item * 2
+
+    assert utils.map_concurrently(double, [1, 2, 3, 4], max_workers=2) == [
+        (1, 2),
+        (2, errors[2]),
+        (3, errors[3]),
+        (4, 8),
+    ]
+
+
 class TestEncodedId:
     def test_init_str(self):
         obj = utils.EncodedId("Hello")
@@ -55,6 +108,13 @@ class TestEncodedId:
         assert "this%2Fis%20a%2Fpath" == f"{obj}"
         assert isinstance(obj, utils.EncodedId)
 
+    @pytest.mark.parametrize(
+        "value",
+        ["src/main.py", "a-b_c.d~e", "", "with space/x", "ünï/cödé", "a%2Fb", "a+b"],
+    )
+    def test_init_str_matches_quote(self, value):
+        assert utils.EncodedId(value) == urllib.parse.quote(value, safe="")
+
     def test_init_int(self):
         obj = utils.EncodedId(23)
         assert "23" == obj